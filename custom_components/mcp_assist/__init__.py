@@ -21,6 +21,7 @@ from .const import (
     CONF_ALLOWED_IPS,
     CONF_SEARCH_PROVIDER,
     CONF_ENABLE_GAP_FILLING,
+    SEARCH_PROVIDER_BRAVE,
     DEFAULT_ENABLE_CUSTOM_TOOLS,
     DEFAULT_BRAVE_API_KEY,
     DEFAULT_ALLOWED_IPS,
@@ -55,8 +56,20 @@ async def _migrate_brave_search_tool_name(hass: HomeAssistant, entry: ConfigEntr
 
 def get_system_entry(hass: HomeAssistant) -> ConfigEntry | None:
     """Get the system config entry that stores shared MCP settings."""
+    # Shared settings are read on every request; remember the entry ID so
+    # later lookups are a single dict probe instead of a scan of all entries
+    domain_data = hass.data.get(DOMAIN)
+    if domain_data is not None:
+        entry_id = domain_data.get("system_entry_id")
+        if entry_id is not None:
+            entry = hass.config_entries.async_get_entry(entry_id)
+            if entry is not None:
+                return entry
+
     for entry in hass.config_entries.async_entries(DOMAIN):
         if entry.unique_id == SYSTEM_ENTRY_UNIQUE_ID:
+            if domain_data is not None:
+                domain_data["system_entry_id"] = entry.entry_id
             return entry
     return None
 
@@ -89,7 +102,7 @@ async def ensure_system_entry(hass: HomeAssistant) -> ConfigEntry:
             # Backward compat: if search_provider not set but enable_custom_tools was True, use "brave"
             if not search_provider:
                 if first_profile.options.get(CONF_ENABLE_CUSTOM_TOOLS, first_profile.data.get(CONF_ENABLE_CUSTOM_TOOLS, False)):
-                    search_provider = "brave"
+                    search_provider = SEARCH_PROVIDER_BRAVE
                 else:
                     search_provider = DEFAULT_SEARCH_PROVIDER
 
@@ -148,6 +161,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Skip setup for system entry (it only stores config, doesn't create entities)
     if entry.unique_id == SYSTEM_ENTRY_UNIQUE_ID:
         _LOGGER.debug("Skipping setup for system entry (config only)")
+        # Shared settings changes must reach the shared MCP server, which
+        # survives reloads of individual profiles
+        entry.async_on_unload(entry.add_update_listener(async_update_system_options))
         return True
 
     profile_name = entry.data.get("profile_name", "Default")
@@ -237,6 +253,16 @@ async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
     await hass.config_entries.async_reload(entry.entry_id)
 
 
+async def async_update_system_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Handle shared settings update."""
+    mcp_server = hass.data.get(DOMAIN, {}).get("shared_mcp_server")
+    if mcp_server is None:
+        return
+
+    _LOGGER.debug("Shared settings updated, checking custom tools")
+    await mcp_server.async_update_custom_tools()
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     # System entry doesn't need unloading (no platforms)
@@ -5,6 +5,7 @@ import json
 import logging
 import re
 import uuid
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Literal
 
 import aiohttp
@@ -71,6 +72,11 @@ from .const import (
     DEFAULT_FOLLOW_UP_PHRASES,
     DEFAULT_END_WORDS,
     RESPONSE_MODE_INSTRUCTIONS,
+    RESPONSE_MODE_NONE,
+    RESPONSE_MODE_DEFAULT,
+    RESPONSE_MODE_ALWAYS,
+    SEARCH_PROVIDER_NONE,
+    SEARCH_PROVIDER_BRAVE,
     SERVER_TYPE_LMSTUDIO,
     SERVER_TYPE_LLAMACPP,
     SERVER_TYPE_OLLAMA,
@@ -87,6 +93,46 @@ from .conversation_history import ConversationHistory
 
 _LOGGER = logging.getLogger(__name__)
 
+# Placeholders supported in the Technical Instructions
+_PROMPT_PLACEHOLDER_RE = re.compile(r"\{(time|date|current_area|response_mode|index)\}")
+
+
+def render_technical_prompt(template: str, **values: str) -> str:
+    """Substitute prompt placeholders in a single pass over the template.
+
+    Placeholders without a provided value are left untouched.
+    """
+    return _PROMPT_PLACEHOLDER_RE.sub(
+        lambda match: values.get(match.group(1), match.group(0)),
+        template
+    )
+
+
+@lru_cache(maxsize=32)
+def _parse_phrases(raw: str) -> tuple[str, ...]:
+    """Split a comma-separated phrase setting into lowercase phrases."""
+    return tuple(phrase for phrase in (part.strip().lower() for part in raw.split(',')) if phrase)
+
+
+@lru_cache(maxsize=32)
+def _compile_phrase_pattern(raw: str) -> re.Pattern | None:
+    """Compile a comma-separated phrase setting into one alternation pattern."""
+    phrases = _parse_phrases(raw)
+    if not phrases:
+        return None
+    # Longest first so the reported match is the most specific phrase
+    return re.compile("|".join(re.escape(phrase) for phrase in sorted(phrases, key=len, reverse=True)))
+
+
+@lru_cache(maxsize=32)
+def _split_end_words(raw: str) -> tuple[tuple[str, ...], frozenset[str]]:
+    """Split end words into (multi-word phrases, single words)."""
+    words = _parse_phrases(raw)
+    return (
+        tuple(word for word in words if ' ' in word),
+        frozenset(word for word in words if ' ' not in word),
+    )
+
 
 class MCPAssistConversationEntity(ConversationEntity):
     """MCP Assist conversation entity with multi-provider support."""
@@ -271,9 +317,9 @@ class MCPAssistConversationEntity(ConversationEntity):
 
         # Backward compat: if old enable_custom_tools was True, default to "brave"
         if self._get_shared_setting(CONF_ENABLE_CUSTOM_TOOLS, False):
-            return "brave"
+            return SEARCH_PROVIDER_BRAVE
 
-        return "none"
+        return SEARCH_PROVIDER_NONE
 
     @property
     def attribution(self) -> str:
@@ -569,7 +615,7 @@ class MCPAssistConversationEntity(ConversationEntity):
 
             # Check if user wants to end (stopwords+1 algorithm)
             user_wants_to_end = False
-            if self.follow_up_mode in ["default", "always"]:
+            if self.follow_up_mode in (RESPONSE_MODE_DEFAULT, RESPONSE_MODE_ALWAYS):
                 user_wants_to_end = self._detect_user_ending_intent(user_input.text)
                 if user_wants_to_end and self.debug_mode:
                     _LOGGER.info("🎯 User ending intent detected (stopwords+1)")
@@ -578,10 +624,10 @@ class MCPAssistConversationEntity(ConversationEntity):
             if user_wants_to_end:
                 # User explicitly wants to end
                 continue_conversation = False
-            elif self.follow_up_mode == "always":
+            elif self.follow_up_mode == RESPONSE_MODE_ALWAYS:
                 # Always continue regardless of tool
                 continue_conversation = True
-            elif self.follow_up_mode == "none":
+            elif self.follow_up_mode == RESPONSE_MODE_NONE:
                 # Never continue regardless of tool
                 continue_conversation = False
             else:  # "default" - smart mode
@@ -645,15 +691,12 @@ class MCPAssistConversationEntity(ConversationEntity):
         if not text:
             return False
 
-        # Parse end words from config
-        end_words_raw = [word.strip().lower() for word in self.end_words.split(',') if word.strip()]
-        if not end_words_raw:
+        # Parse end words from config (cached per setting value), separating
+        # multi-word phrases from single words
+        multi_word_phrases, single_words = _split_end_words(self.end_words)
+        if not multi_word_phrases and not single_words:
             return False
 
-        # Separate multi-word phrases from single words
-        multi_word_phrases = [phrase for phrase in end_words_raw if ' ' in phrase]
-        single_words = [word for word in end_words_raw if ' ' not in word]
-
         # Normalize text
         text_lower = text.lower().strip()
 
@@ -707,14 +750,13 @@ class MCPAssistConversationEntity(ConversationEntity):
                 _LOGGER.info("📊 Question detected: phrase ends with question mark")
             return True
 
-        # Pattern 2: Question phrases (user-configurable)
-        question_phrases = [phrase.strip().lower() for phrase in self.follow_up_phrases.split(',') if phrase.strip()]
-
-        for phrase in question_phrases:
-            if phrase in check_text:
-                if self.debug_mode:
-                    _LOGGER.info(f"📊 Follow-up phrase detected: '{phrase}'")
-                return True
+        # Pattern 2: Question phrases (user-configurable, compiled once per setting value)
+        pattern = _compile_phrase_pattern(self.follow_up_phrases)
+        match = pattern.search(check_text) if pattern else None
+        if match:
+            if self.debug_mode:
+                _LOGGER.info(f"📊 Follow-up phrase detected: '{match.group(0)}'")
+            return True
 
         return False
 
@@ -767,19 +809,11 @@ class MCPAssistConversationEntity(ConversationEntity):
             technical_prompt = self.entry.options.get(CONF_TECHNICAL_PROMPT,
                                                        self.entry.data.get(CONF_TECHNICAL_PROMPT, DEFAULT_TECHNICAL_PROMPT))
 
-            # Format time and date variables
-            current_time = dt_util.now().strftime('%H:%M:%S')
-            current_date = dt_util.now().strftime('%Y-%m-%d')
-            technical_prompt = technical_prompt.replace('{time}', current_time)
-            technical_prompt = technical_prompt.replace('{date}', current_date)
-
             # Get current area from satellite (if available)
             current_area = await self._get_current_area(user_input)
-            technical_prompt = technical_prompt.replace('{current_area}', current_area)
 
-            # Inject mode-specific instructions
-            mode_instructions = RESPONSE_MODE_INSTRUCTIONS.get(self.follow_up_mode, RESPONSE_MODE_INSTRUCTIONS["default"])
-            technical_prompt = technical_prompt.replace('{response_mode}', mode_instructions)
+            # Mode-specific instructions
+            mode_instructions = RESPONSE_MODE_INSTRUCTIONS.get(self.follow_up_mode, RESPONSE_MODE_INSTRUCTIONS[RESPONSE_MODE_DEFAULT])
 
             # Get Smart Entity Index from IndexManager
             index_manager = self.hass.data.get(DOMAIN, {}).get("index_manager")
@@ -790,8 +824,16 @@ class MCPAssistConversationEntity(ConversationEntity):
                 index_json = "{}"
                 _LOGGER.warning("IndexManager not available, using empty index")
 
-            # Replace {index} placeholder
-            technical_prompt = technical_prompt.replace('{index}', index_json)
+            # Fill all placeholders in one pass
+            now = dt_util.now()
+            technical_prompt = render_technical_prompt(
+                technical_prompt,
+                time=now.strftime('%H:%M:%S'),
+                date=now.strftime('%Y-%m-%d'),
+                current_area=current_area,
+                response_mode=mode_instructions,
+                index=index_json,
+            )
 
             # Combine: system prompt + technical prompt
             return f"{system_prompt}\n\n{technical_prompt}"
@@ -838,15 +880,15 @@ class MCPAssistConversationEntity(ConversationEntity):
             technical_prompt = self.entry.options.get(CONF_TECHNICAL_PROMPT,
                                                        self.entry.data.get(CONF_TECHNICAL_PROMPT, DEFAULT_TECHNICAL_PROMPT))
 
-            # Format time and date variables
-            current_time = dt_util.now().strftime('%H:%M:%S')
-            current_date = dt_util.now().strftime('%Y-%m-%d')
-
             # Replace placeholders in technical prompt
-            technical_prompt = technical_prompt.replace('{time}', current_time)
-            technical_prompt = technical_prompt.replace('{date}', current_date)
-            technical_prompt = technical_prompt.replace('{current_area}', 'Unknown')
-            technical_prompt = technical_prompt.replace('{index}', '{}')
+            now = dt_util.now()
+            technical_prompt = render_technical_prompt(
+                technical_prompt,
+                time=now.strftime('%H:%M:%S'),
+                date=now.strftime('%Y-%m-%d'),
+                current_area='Unknown',
+                index='{}',
+            )
 
             # Combine prompts
             return f"{system_prompt}\n\n{technical_prompt}"
@@ -62,6 +62,12 @@ from .const import (
     SERVER_TYPE_GEMINI,
     SERVER_TYPE_ANTHROPIC,
     SERVER_TYPE_OPENROUTER,
+    SEARCH_PROVIDER_NONE,
+    SEARCH_PROVIDER_BRAVE,
+    SEARCH_PROVIDER_DUCKDUCKGO,
+    RESPONSE_MODE_NONE,
+    RESPONSE_MODE_DEFAULT,
+    RESPONSE_MODE_ALWAYS,
     DEFAULT_SERVER_TYPE,
     DEFAULT_LMSTUDIO_URL,
     DEFAULT_LLAMACPP_URL,
@@ -607,9 +613,9 @@ class MCPAssistConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             vol.Required(CONF_RESPONSE_MODE, default=DEFAULT_RESPONSE_MODE): SelectSelector(
                 SelectSelectorConfig(
                     options=[
-                        {"value": "none", "label": "None"},
-                        {"value": "default", "label": "Smart"},
-                        {"value": "always", "label": "Always"},
+                        {"value": RESPONSE_MODE_NONE, "label": "None"},
+                        {"value": RESPONSE_MODE_DEFAULT, "label": "Smart"},
+                        {"value": RESPONSE_MODE_ALWAYS, "label": "Always"},
                     ],
                     mode=SelectSelectorMode.DROPDOWN,
                 )
@@ -713,9 +719,9 @@ class MCPAssistConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             vol.Required(CONF_SEARCH_PROVIDER, default=DEFAULT_SEARCH_PROVIDER): SelectSelector(
                 SelectSelectorConfig(
                     options=[
-                        {"value": "none", "label": "Disabled"},
-                        {"value": "duckduckgo", "label": "DuckDuckGo"},
-                        {"value": "brave", "label": "Brave Search (requires API key)"},
+                        {"value": SEARCH_PROVIDER_NONE, "label": "Disabled"},
+                        {"value": SEARCH_PROVIDER_DUCKDUCKGO, "label": "DuckDuckGo"},
+                        {"value": SEARCH_PROVIDER_BRAVE, "label": "Brave Search (requires API key)"},
                     ],
                     mode=SelectSelectorMode.DROPDOWN,
                 )
@@ -772,7 +778,7 @@ class MCPAssistOptionsFlow(config_entries.OptionsFlow):
 
         # Backward compat: if old enable_custom_tools was True, default to "brave"
         if options.get(CONF_ENABLE_CUSTOM_TOOLS, data.get(CONF_ENABLE_CUSTOM_TOOLS, False)):
-            return "brave"
+            return SEARCH_PROVIDER_BRAVE
 
         return DEFAULT_SEARCH_PROVIDER
 
@@ -960,9 +966,9 @@ class MCPAssistOptionsFlow(config_entries.OptionsFlow):
                 ): SelectSelector(
                     SelectSelectorConfig(
                         options=[
-                            {"value": "none", "label": "None"},
-                            {"value": "default", "label": "Smart"},
-                            {"value": "always", "label": "Always"},
+                            {"value": RESPONSE_MODE_NONE, "label": "None"},
+                            {"value": RESPONSE_MODE_DEFAULT, "label": "Smart"},
+                            {"value": RESPONSE_MODE_ALWAYS, "label": "Always"},
                         ],
                         mode=SelectSelectorMode.DROPDOWN,
                     )
@@ -1074,9 +1080,9 @@ class MCPAssistOptionsFlow(config_entries.OptionsFlow):
             ): SelectSelector(
                 SelectSelectorConfig(
                     options=[
-                        {"value": "none", "label": "Disabled"},
-                        {"value": "duckduckgo", "label": "DuckDuckGo"},
-                        {"value": "brave", "label": "Brave Search (requires API key)"},
+                        {"value": SEARCH_PROVIDER_NONE, "label": "Disabled"},
+                        {"value": SEARCH_PROVIDER_DUCKDUCKGO, "label": "DuckDuckGo"},
+                        {"value": SEARCH_PROVIDER_BRAVE, "label": "Brave Search (requires API key)"},
                     ],
                     mode=SelectSelectorMode.DROPDOWN,
                 )
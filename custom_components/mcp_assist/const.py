@@ -1,5 +1,7 @@
 """Constants for the MCP Assist integration."""
 
+from types import MappingProxyType
+
 DOMAIN = "mcp_assist"
 SYSTEM_ENTRY_UNIQUE_ID = "mcp_assist_system_settings"
 
@@ -12,6 +14,16 @@ SERVER_TYPE_GEMINI = "gemini"
 SERVER_TYPE_ANTHROPIC = "anthropic"
 SERVER_TYPE_OPENROUTER = "openrouter"
 
+# Search provider options
+SEARCH_PROVIDER_NONE = "none"
+SEARCH_PROVIDER_BRAVE = "brave"
+SEARCH_PROVIDER_DUCKDUCKGO = "duckduckgo"
+
+# Response mode options
+RESPONSE_MODE_NONE = "none"
+RESPONSE_MODE_DEFAULT = "default"
+RESPONSE_MODE_ALWAYS = "always"
+
 # Configuration keys
 CONF_PROFILE_NAME = "profile_name"
 CONF_SERVER_TYPE = "server_type"
@@ -58,8 +70,8 @@ OPENROUTER_BASE_URL = "https://openrouter.ai/api"
 DEFAULT_MODEL_NAME = "model"
 DEFAULT_SYSTEM_PROMPT = "You are a helpful Home Assistant voice assistant. Respond naturally and conversationally to user requests."
 DEFAULT_CONTROL_HA = True
-DEFAULT_RESPONSE_MODE = "default"
-DEFAULT_FOLLOW_UP_MODE = "default"  # Keep for backward compatibility
+DEFAULT_RESPONSE_MODE = RESPONSE_MODE_DEFAULT
+DEFAULT_FOLLOW_UP_MODE = RESPONSE_MODE_DEFAULT  # Keep for backward compatibility
 DEFAULT_TEMPERATURE = 0.5
 DEFAULT_MAX_TOKENS = 500
 DEFAULT_MAX_HISTORY = 10
@@ -68,7 +80,7 @@ DEFAULT_DEBUG_MODE = False
 DEFAULT_ENABLE_CUSTOM_TOOLS = False
 DEFAULT_BRAVE_API_KEY = ""
 DEFAULT_ALLOWED_IPS = ""
-DEFAULT_SEARCH_PROVIDER = "none"
+DEFAULT_SEARCH_PROVIDER = SEARCH_PROVIDER_NONE
 DEFAULT_ENABLE_GAP_FILLING = True
 DEFAULT_OLLAMA_KEEP_ALIVE = "5m"  # 5 minutes
 DEFAULT_OLLAMA_NUM_CTX = 0  # 0 = use model default
@@ -83,14 +95,15 @@ MCP_PROTOCOL_VERSION = "2024-11-05"
 MAX_ENTITIES_PER_DISCOVERY = 50
 MAX_DISCOVERY_RESULTS = 100
 
-RESPONSE_MODE_INSTRUCTIONS = {
-    "none": """## Follow-up Questions
+# Read-only view: shared by every profile, must never be mutated at runtime
+RESPONSE_MODE_INSTRUCTIONS = MappingProxyType({
+    RESPONSE_MODE_NONE: """## Follow-up Questions
 Do NOT ask follow-up questions. Complete the task and end immediately.
 
 ## Ending Conversations
 Always end after completing the task.""",
 
-    "default": """## Follow-up Questions
+    RESPONSE_MODE_DEFAULT: """## Follow-up Questions
 Generate contextually appropriate follow-up questions naturally:
 - After single device actions: Create a natural follow-up asking if the user needs help with anything else (vary phrasing each time)
 - When reporting adjustable status: Spontaneously suggest adjusting it in a natural way
@@ -103,7 +116,7 @@ When asking a question, use the set_conversation_state tool to indicate you're e
 ## Ending Conversations
 After completing the task, end the conversation unless a natural follow-up is relevant.""",
 
-    "always": """## Follow-up Questions
+    RESPONSE_MODE_ALWAYS: """## Follow-up Questions
 Generate contextually appropriate follow-up questions naturally:
 - After single device actions: Create a natural follow-up asking if the user needs help with anything else (vary phrasing each time)
 - When reporting adjustable status: Spontaneously suggest adjusting it in a natural way
@@ -113,7 +126,7 @@ When asking a question, use the set_conversation_state tool to indicate you're e
 
 ## Ending Conversations
 When user indicates they're done, acknowledge and end naturally."""
-}
+})
 
 DEFAULT_TECHNICAL_PROMPT = """You are controlling a Home Assistant smart home system. You have access to sensors, lights, switches, and other devices throughout the home.
 
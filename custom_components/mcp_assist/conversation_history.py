@@ -1,7 +1,9 @@
 """Conversation history management for LM Studio MCP."""
 
 import logging
-from typing import Any, Dict, List, Optional
+from collections import deque
+from itertools import islice
+from typing import Any, Deque, Dict, List, Optional
 from datetime import datetime, timedelta
 
 _LOGGER = logging.getLogger(__name__)
@@ -14,7 +16,9 @@ class ConversationHistory:
         """Initialize conversation history manager."""
         self.max_history_age = timedelta(hours=max_history_age_hours)
         self.max_turns = max_turns_per_conversation
-        self._conversations: Dict[str, List[Dict[str, Any]]] = {}
+        # Turns are appended in timestamp order, so the oldest is always at the
+        # left; maxlen drops turns beyond max_turns automatically
+        self._conversations: Dict[str, Deque[Dict[str, Any]]] = {}
 
     def add_turn(
         self,
@@ -25,7 +29,7 @@ class ConversationHistory:
     ) -> None:
         """Add a conversation turn."""
         if conversation_id not in self._conversations:
-            self._conversations[conversation_id] = []
+            self._conversations[conversation_id] = deque(maxlen=self.max_turns)
 
         turn = {
             "timestamp": datetime.now(),
@@ -53,34 +57,48 @@ class ConversationHistory:
         # Cleanup old conversations first
         self._cleanup_conversation(conversation_id)
 
-        return self._conversations[conversation_id].copy()
+        return list(self._conversations[conversation_id])
+
+    def get_recent_turns(self, conversation_id: str, max_turns: int = 3) -> List[Dict[str, Any]]:
+        """Get the most recent turns for a conversation ID."""
+        if conversation_id not in self._conversations:
+            return []
+
+        # Cleanup old conversations first
+        self._cleanup_conversation(conversation_id)
+
+        # Copy only the tail instead of the whole conversation
+        conversation = self._conversations.get(conversation_id, ())
+        start = max(len(conversation) - max_turns, 0)
+        return list(islice(conversation, start, None))
 
     def get_recent_context(self, conversation_id: str, max_turns: int = 3) -> str:
         """Get recent conversation context as formatted string."""
-        history = self.get_history(conversation_id)
+        recent_turns = self.get_recent_turns(conversation_id, max_turns)
 
-        if not history:
+        if not recent_turns:
             return ""
 
-        # Get last few turns
-        recent_turns = history[-max_turns:] if len(history) > max_turns else history
-
         context_parts = ["Recent conversation:"]
         for turn in recent_turns:
             context_parts.append(f"User: {turn['user']}")
             context_parts.append(f"Assistant: {turn['assistant']}")
 
             # Add actions taken if any
-            if turn.get("actions"):
-                actions_summary = []
-                for action in turn["actions"]:
-                    if action.get("type") == "intent_executed":
-                        actions_summary.append(f"Executed {action['intent']} on {', '.join(action.get('entity_ids', []))}")
-                    elif action.get("type") == "entities_mentioned":
-                        actions_summary.append(f"Referenced entities: {', '.join(action.get('entity_ids', []))}")
+            actions = turn.get("actions")
+            if not actions:
+                continue
+
+            actions_summary = []
+            for action in actions:
+                action_type = action.get("type")
+                if action_type == "intent_executed":
+                    actions_summary.append(f"Executed {action['intent']} on {', '.join(action.get('entity_ids', ()))}")
+                elif action_type == "entities_mentioned":
+                    actions_summary.append(f"Referenced entities: {', '.join(action.get('entity_ids', ()))}")
 
-                if actions_summary:
-                    context_parts.append(f"Actions: {'; '.join(actions_summary)}")
+            if actions_summary:
+                context_parts.append(f"Actions: {'; '.join(actions_summary)}")
 
         return "\n".join(context_parts)
 
@@ -103,15 +121,9 @@ class ConversationHistory:
         conversation = self._conversations[conversation_id]
         cutoff_time = datetime.now() - self.max_history_age
 
-        # Remove old turns
-        conversation[:] = [
-            turn for turn in conversation
-            if turn["timestamp"] > cutoff_time
-        ]
-
-        # Limit number of turns
-        if len(conversation) > self.max_turns:
-            conversation[:] = conversation[-self.max_turns:]
+        # Remove old turns (expired turns are always at the front)
+        while conversation and conversation[0]["timestamp"] <= cutoff_time:
+            conversation.popleft()
 
         # Remove conversation if empty
         if not conversation:
@@ -125,13 +137,11 @@ class ConversationHistory:
         # Calculate average turns per conversation
         avg_turns = total_turns / total_conversations if total_conversations > 0 else 0
 
-        # Find oldest and newest turns
-        all_timestamps = []
-        for conversation in self._conversations.values():
-            all_timestamps.extend(turn["timestamp"] for turn in conversation)
-
-        oldest = min(all_timestamps) if all_timestamps else None
-        newest = max(all_timestamps) if all_timestamps else None
+        # Find oldest and newest turns (turns are stored in timestamp order,
+        # so only each conversation's first and last turn need comparing)
+        conversations = [conversation for conversation in self._conversations.values() if conversation]
+        oldest = min(conversation[0]["timestamp"] for conversation in conversations) if conversations else None
+        newest = max(conversation[-1]["timestamp"] for conversation in conversations) if conversations else None
 
         return {
             "total_conversations": total_conversations,
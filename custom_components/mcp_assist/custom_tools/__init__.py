@@ -1,9 +1,48 @@
 """Custom tools loader for MCP Assist."""
 import logging
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, List, Tuple
+
+from ..const import (
+    CONF_SEARCH_PROVIDER,
+    CONF_ENABLE_CUSTOM_TOOLS,
+    CONF_BRAVE_API_KEY,
+    DEFAULT_BRAVE_API_KEY,
+    SEARCH_PROVIDER_NONE,
+    SEARCH_PROVIDER_BRAVE,
+    SEARCH_PROVIDER_DUCKDUCKGO,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+
+# Each factory runs a plain relative import on first use, so optional
+# dependencies (e.g. ddgs) are not loaded unless selected. Later calls are
+# served from sys.modules.
+def _create_brave_search(loader: "CustomToolsLoader") -> Any:
+    from .brave_search import BraveSearchTool
+    return BraveSearchTool(loader.hass, loader._brave_api_key)
+
+
+def _create_duckduckgo_search(loader: "CustomToolsLoader") -> Any:
+    from .duckduckgo_search import DuckDuckGoSearchTool
+    return DuckDuckGoSearchTool(loader.hass)
+
+
+def _create_read_url(loader: "CustomToolsLoader") -> Any:
+    from .read_url import ReadUrlTool
+    return ReadUrlTool(loader.hass)
+
+
+_ToolSpec = Tuple[str, str, Callable[["CustomToolsLoader"], Any]]
+
+# Search provider -> (tool key, label, factory)
+_SEARCH_TOOLS: Dict[str, _ToolSpec] = {
+    SEARCH_PROVIDER_BRAVE: ("search", "Brave Search", _create_brave_search),
+    SEARCH_PROVIDER_DUCKDUCKGO: ("search", "DuckDuckGo Search", _create_duckduckgo_search),
+}
+_READ_URL_TOOL: _ToolSpec = ("read_url", "Read URL", _create_read_url)
+
+
 class CustomToolsLoader:
     """Load and manage custom tools."""
 
@@ -12,42 +51,54 @@ class CustomToolsLoader:
         self.hass = hass
         self.entry = entry
         self.tools = {}
+        self._name_to_tool: Dict[str, Any] = {}
+        self._tool_definitions: List[Dict[str, Any]] = []
+
+        # Shared settings are read once; MCPServer builds a new loader when
+        # they change (see is_stale)
+        self._search_provider = self._get_search_provider()
+        self._brave_api_key = self._get_brave_api_key()
 
     async def initialize(self):
         """Initialize custom tools based on search provider selection."""
-        # Determine search provider
-        search_provider = self._get_search_provider()
+        tool_specs: List[_ToolSpec] = []
+        search_tool = _SEARCH_TOOLS.get(self._search_provider)
+        if search_tool is not None:
+            # Load read_url tool if search is enabled
+            tool_specs = [search_tool, _READ_URL_TOOL]
 
-        # Load search tool based on provider
-        if search_provider == "brave":
+        for key, label, factory in tool_specs:
             try:
-                from .brave_search import BraveSearchTool
-                # Get Brave API key from system entry (shared setting)
-                api_key = self._get_brave_api_key()
-                self.tools["search"] = BraveSearchTool(self.hass, api_key)
-                await self.tools["search"].initialize()
-                _LOGGER.debug("✅ Brave Search tool initialized")
+                self.tools[key] = factory(self)
+                await self.tools[key].initialize()
+                _LOGGER.debug(f"✅ {label} tool initialized")
             except Exception as e:
-                _LOGGER.error(f"Failed to initialize Brave Search tool: {e}")
+                _LOGGER.error(f"Failed to initialize {label} tool: {e}")
 
-        elif search_provider == "duckduckgo":
+        # Tool definitions are fixed once tools are loaded: collect them once
+        # and build the tool name -> tool index for O(1) dispatch
+        self._name_to_tool = {}
+        self._tool_definitions = []
+        for tool in self.tools.values():
             try:
-                from .duckduckgo_search import DuckDuckGoSearchTool
-                self.tools["search"] = DuckDuckGoSearchTool(self.hass)
-                await self.tools["search"].initialize()
-                _LOGGER.debug("✅ DuckDuckGo Search tool initialized")
+                definitions = tool.get_tool_definitions()
             except Exception as e:
-                _LOGGER.error(f"Failed to initialize DuckDuckGo Search tool: {e}")
+                _LOGGER.error(f"Error getting tool definitions: {e}")
+                continue
+            self._tool_definitions.extend(definitions)
+            for definition in definitions:
+                self._name_to_tool[definition["name"]] = tool
 
-        # Load read_url tool if search is enabled
-        if search_provider in ["brave", "duckduckgo"]:
+    async def close(self):
+        """Release resources held by tools (e.g. HTTP sessions)."""
+        for tool in self.tools.values():
+            close = getattr(tool, "close", None)
+            if close is None:
+                continue
             try:
-                from .read_url import ReadUrlTool
-                self.tools["read_url"] = ReadUrlTool(self.hass)
-                await self.tools["read_url"].initialize()
-                _LOGGER.debug("✅ Read URL tool initialized")
+                await close()
             except Exception as e:
-                _LOGGER.error(f"Failed to initialize read_url tool: {e}")
+                _LOGGER.error(f"Error closing custom tool: {e}")
 
     def _get_shared_setting(self, key: str, default: Any = None) -> Any:
         """Get a shared setting from system entry with fallback to profile entry."""
@@ -72,44 +123,40 @@ class CustomToolsLoader:
 
     def _get_search_provider(self) -> str:
         """Get search provider (shared setting) with backward compatibility."""
-        from ..const import CONF_SEARCH_PROVIDER, CONF_ENABLE_CUSTOM_TOOLS
-
         provider = self._get_shared_setting(CONF_SEARCH_PROVIDER)
         if provider:
             return provider
 
         # Backward compat: if old enable_custom_tools was True, default to "brave"
         if self._get_shared_setting(CONF_ENABLE_CUSTOM_TOOLS, False):
-            return "brave"
+            return SEARCH_PROVIDER_BRAVE
 
-        return "none"
+        return SEARCH_PROVIDER_NONE
 
     def _get_brave_api_key(self) -> str:
         """Get Brave API key (shared setting)."""
-        from ..const import CONF_BRAVE_API_KEY, DEFAULT_BRAVE_API_KEY
         return self._get_shared_setting(CONF_BRAVE_API_KEY, DEFAULT_BRAVE_API_KEY)
 
+    def is_stale(self) -> bool:
+        """Check if the shared search settings changed since this loader was built."""
+        return (
+            self._get_search_provider() != self._search_provider
+            or self._get_brave_api_key() != self._brave_api_key
+        )
+
     def get_tool_definitions(self) -> List[Dict[str, Any]]:
         """Get MCP tool definitions for all enabled tools."""
-        definitions = []
-        for tool in self.tools.values():
-            try:
-                definitions.extend(tool.get_tool_definitions())
-            except Exception as e:
-                _LOGGER.error(f"Error getting tool definitions: {e}")
-        return definitions
+        return self._tool_definitions
 
     async def handle_tool_call(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Handle a custom tool call."""
-        for tool in self.tools.values():
-            if tool.handles_tool(tool_name):
-                return await tool.handle_call(tool_name, arguments)
+        try:
+            tool = self._name_to_tool[tool_name]
+        except KeyError:
+            raise ValueError(f"Unknown custom tool: {tool_name}") from None
 
-        raise ValueError(f"Unknown custom tool: {tool_name}")
+        return await tool.handle_call(tool_name, arguments)
 
     def is_custom_tool(self, tool_name: str) -> bool:
         """Check if a tool name is a custom tool."""
-        for tool in self.tools.values():
-            if tool.handles_tool(tool_name):
-                return True
-        return False
\ No newline at end of file
+        return tool_name in self._name_to_tool
\ No newline at end of file
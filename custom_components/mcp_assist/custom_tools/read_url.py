@@ -1,11 +1,55 @@
 """Read URL custom tool for ha-lmstudio-mcp."""
 import aiohttp
+import codecs
 import logging
+import re
+from functools import lru_cache
+from html import unescape
 from typing import Dict, Any, List
-from urllib.parse import urlparse
+from urllib.parse import ParseResult, urlparse
+
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
 
 _LOGGER = logging.getLogger(__name__)
 
+# Compiled once; _extract_text runs on every fetched page. Script/style
+# blocks and comments share one alternation so they are dropped in one pass.
+_NON_CONTENT_RE = re.compile(
+    r'<script[^>]*>.*?</script>|<style[^>]*>.*?</style>|<!--.*?-->',
+    re.DOTALL | re.IGNORECASE
+)
+_TAG_RE = re.compile(r'<[^>]+>')
+_TITLE_RE = re.compile(r'<title[^>]*>(.*?)</title>', re.DOTALL | re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Bytes of raw HTML to read per character of max_content_length. Markup,
+# scripts and styles usually outweigh the extracted text several times over.
+_BODY_BYTES_PER_CHAR = 10
+_READ_CHUNK_SIZE = 8192
+
+_ALLOWED_SCHEMES = frozenset(('http', 'https'))
+
+# Sent per request: Home Assistant sessions replace session-level User-Agent
+_REQUEST_HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; ha-lmstudio-mcp/1.0)"}
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=15)
+
+
+def _resolve_charset(charset: str | None) -> str:
+    """Return a codec name Python knows for a Content-Type charset label."""
+    if charset:
+        try:
+            return codecs.lookup(charset).name
+        except (LookupError, ValueError):
+            _LOGGER.debug("Unknown charset %r, decoding as utf-8", charset)
+    return 'utf-8'
+
+
+@lru_cache(maxsize=256)
+def _parse_url(url: str) -> ParseResult:
+    """Parse a URL, caching results for URLs read again in later turns."""
+    return urlparse(url)
+
+
 class ReadUrlTool:
     """Tool to read and extract content from URLs."""
 
@@ -13,10 +57,23 @@ class ReadUrlTool:
         """Initialize Read URL tool."""
         self.hass = hass
         self.max_content_length = 50000  # Max characters to return
+        self._session: aiohttp.ClientSession | None = None
 
     async def initialize(self):
         """Initialize the tool."""
-        pass  # No logging needed
+        # One session for all reads, on Home Assistant's pooled connector.
+        # Home Assistant closes it on shutdown; close() covers unloads.
+        self._session = self._create_session()
+
+    async def close(self):
+        """Close the HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Create the HTTP session used for reading URLs."""
+        return async_create_clientsession(self.hass, timeout=_REQUEST_TIMEOUT)
 
     def handles_tool(self, tool_name: str) -> bool:
         """Check if this class handles the given tool."""
@@ -54,7 +111,7 @@ class ReadUrlTool:
         _LOGGER.debug(f"Reading URL: {url}")
 
         # Validate URL
-        parsed = urlparse(url)
+        parsed = _parse_url(url)
         if not parsed.scheme or not parsed.netloc:
             return {
                 "content": [{
@@ -64,7 +121,7 @@ class ReadUrlTool:
             }
 
         # Ensure HTTPS for security
-        if parsed.scheme not in ['http', 'https']:
+        if parsed.scheme not in _ALLOWED_SCHEMES:
             return {
                 "content": [{
                     "type": "text",
@@ -73,72 +130,64 @@ class ReadUrlTool:
             }
 
         try:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (compatible; ha-lmstudio-mcp/1.0)"
-            }
+            if self._session is None or self._session.closed:
+                self._session = self._create_session()
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=15),
-                    allow_redirects=True
-                ) as response:
-                    if response.status != 200:
-                        return {
-                            "content": [{
-                                "type": "text",
-                                "text": f"❌ HTTP {response.status}: Failed to fetch URL"
-                            }]
-                        }
-
-                    # Check content type
-                    content_type = response.headers.get('Content-Type', '')
-                    if 'text/html' not in content_type and 'text/plain' not in content_type:
-                        return {
-                            "content": [{
-                                "type": "text",
-                                "text": f"❌ Unsupported content type: {content_type}"
-                            }]
-                        }
-
-                    html = await response.text()
-
-                    # Simple text extraction without BeautifulSoup dependency
-                    text = await self._extract_text(html, content_type)
-
-                    # Get title from HTML
-                    title = parsed.netloc
-                    if '<title>' in html and '</title>' in html:
-                        title_start = html.index('<title>') + 7
-                        title_end = html.index('</title>')
-                        title = html[title_start:title_end].strip()
-
-                    # Truncate if needed
-                    truncated = False
-                    if len(text) > self.max_content_length:
-                        text = text[:self.max_content_length] + "..."
-                        truncated = True
-
-                    # Create summary if requested
-                    if summary_only and len(text) > 1000:
-                        # Take first 1000 chars as simple summary
-                        text = text[:1000] + "..."
-
-                    result_text = f"📖 **{title}**\n"
-                    result_text += f"URL: {url}\n"
-                    result_text += f"Length: {len(text)} chars"
-                    if truncated:
-                        result_text += " (truncated)"
-                    result_text += f"\n\n{text}"
+            async with self._session.get(
+                url, headers=_REQUEST_HEADERS, allow_redirects=True
+            ) as response:
+                if response.status != 200:
+                    return {
+                        "content": [{
+                            "type": "text",
+                            "text": f"❌ HTTP {response.status}: Failed to fetch URL"
+                        }]
+                    }
 
+                # Check content type
+                content_type = response.headers.get('Content-Type', '')
+                if 'text/html' not in content_type and 'text/plain' not in content_type:
                     return {
                         "content": [{
                             "type": "text",
-                            "text": result_text
+                            "text": f"❌ Unsupported content type: {content_type}"
                         }]
                     }
 
+                html = await self._read_body(response)
+
+                # Get title from HTML
+                title_match = _TITLE_RE.search(html)
+                title = title_match.group(1).strip() if title_match else parsed.netloc
+
+                # Simple text extraction without BeautifulSoup dependency
+                text = await self._extract_text(html, content_type)
+
+                # Truncate if needed
+                truncated = False
+                if len(text) > self.max_content_length:
+                    text = text[:self.max_content_length] + "..."
+                    truncated = True
+
+                # Create summary if requested
+                if summary_only and len(text) > 1000:
+                    # Take first 1000 chars as simple summary
+                    text = text[:1000] + "..."
+
+                result_text = f"📖 **{title}**\n"
+                result_text += f"URL: {url}\n"
+                result_text += f"Length: {len(text)} chars"
+                if truncated:
+                    result_text += " (truncated)"
+                result_text += f"\n\n{text}"
+
+                return {
+                    "content": [{
+                        "type": "text",
+                        "text": result_text
+                    }]
+                }
+
         except aiohttp.ClientTimeout:
             return {
                 "content": [{
@@ -155,39 +204,38 @@ class ReadUrlTool:
                 }]
             }
 
+    async def _read_body(self, response: aiohttp.ClientResponse) -> str:
+        """Read the response body, stopping once enough HTML is buffered.
+
+        Always streams: Content-Length is the compressed size and aiohttp
+        decompresses transparently, so only the decoded chunks bound memory.
+        """
+        limit = self.max_content_length * _BODY_BYTES_PER_CHAR
+        charset = _resolve_charset(response.charset)
+
+        buffer = bytearray()
+        async for chunk in response.content.iter_chunked(_READ_CHUNK_SIZE):
+            buffer.extend(chunk)
+            if len(buffer) >= limit:
+                _LOGGER.debug("Stopped reading URL body after %d bytes", len(buffer))
+                break
+
+        return buffer.decode(charset, errors='replace')
+
     async def _extract_text(self, html: str, content_type: str) -> str:
         """Extract text from HTML without BeautifulSoup."""
         if 'text/plain' in content_type:
             return html
 
         # Basic HTML tag removal (simplified without BeautifulSoup)
-        import re
+        # Remove script and style blocks and HTML comments
+        html = _NON_CONTENT_RE.sub('', html)
 
-        # Remove script and style blocks
-        html = re.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.DOTALL | re.IGNORECASE)
-        html = re.sub(r'<style[^>]*>.*?</style>', '', html, flags=re.DOTALL | re.IGNORECASE)
+        # Remove HTML tags
+        html = _TAG_RE.sub(' ', html)
 
-        # Remove HTML comments
-        html = re.sub(r'<!--.*?-->', '', html, flags=re.DOTALL)
+        # Decode HTML entities (named and numeric) in one pass
+        html = unescape(html)
 
-        # Remove HTML tags
-        html = re.sub(r'<[^>]+>', ' ', html)
-
-        # Decode HTML entities
-        html = html.replace('&amp;', '&')
-        html = html.replace('&lt;', '<')
-        html = html.replace('&gt;', '>')
-        html = html.replace('&quot;', '"')
-        html = html.replace('&#39;', "'")
-        html = html.replace('&nbsp;', ' ')
-
-        # Clean up whitespace
-        lines = html.split('\n')
-        lines = [line.strip() for line in lines]
-        lines = [line for line in lines if line]
-        text = '\n'.join(lines)
-
-        # Replace multiple spaces with single space
-        text = re.sub(r'\s+', ' ', text)
-
-        return text.strip()
\ No newline at end of file
+        # Collapse all whitespace, including line breaks, to single spaces
+        return _WHITESPACE_RE.sub(' ', html).strip()
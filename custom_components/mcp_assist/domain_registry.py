@@ -4,10 +4,10 @@ This module contains all domain service mappings and validation logic.
 Centralizes domain definitions to keep the main MCP server clean and maintainable.
 """
 
-from typing import Dict, List, Tuple, Optional, Any
-import logging
-
-_LOGGER = logging.getLogger(__name__)
+import difflib
+from itertools import islice
+from types import MappingProxyType
+from typing import Callable, Dict, FrozenSet, List, Mapping, Tuple, Optional, Any
 
 # Priority levels for domain implementation
 PRIORITY_ESSENTIAL = 1  # Must have for basic HA control
@@ -21,7 +21,11 @@ TYPE_CONTROLLABLE = "controllable"
 TYPE_READ_ONLY = "read_only"
 TYPE_SERVICE_ONLY = "service_only"
 
-# Complete domain registry with all services and parameters
+# Shared default for lookups that find nothing (avoids a new dict per call)
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+# Complete domain registry with all services and parameters.
+# Every entry defines "type", "priority", "services" and "parameters".
 DOMAIN_REGISTRY = {
     # ========== P1: Essential Core Domains ==========
     "light": {
@@ -723,7 +727,21 @@ DOMAIN_REGISTRY = {
     }
 }
 
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# The registry is static: freeze it so shared entries cannot be mutated
+DOMAIN_REGISTRY: Mapping[str, Mapping[str, Any]] = _freeze(DOMAIN_REGISTRY)
+
 # Common action aliases that map to standard services
+# Aliases that apply to every domain
 ACTION_ALIASES = {
     # Common aliases for turn_on/turn_off
     "activate": "turn_on",
@@ -733,16 +751,6 @@ ACTION_ALIASES = {
     "start": "turn_on",
     "stop": "turn_off",
 
-    # Lock-specific aliases
-    "secure": "lock",
-    "unsecure": "unlock",
-
-    # Cover-specific aliases
-    "open": "open_cover",
-    "close": "close_cover",
-    "raise": "open_cover",
-    "lower": "close_cover",
-
     # Media player aliases
     "play": "media_play",
     "pause": "media_pause",
@@ -753,22 +761,134 @@ ACTION_ALIASES = {
     # Climate aliases
     "heat": "set_hvac_mode",
     "cool": "set_hvac_mode",
+}
 
-    # Vacuum aliases
-    "clean": "start",
-    "dock": "return_to_base",
-    "home": "return_to_base"
+# Aliases that only apply to a single domain (checked before ACTION_ALIASES)
+DOMAIN_ACTION_ALIASES = {
+    "cover": {
+        "open": "open_cover",
+        "close": "close_cover",
+        "raise": "open_cover",
+        "lift": "open_cover",
+        "lower": "close_cover",
+        "drop": "close_cover",
+    },
+    "lock": {
+        "secure": "lock",
+        "unsecure": "unlock",
+    },
+    "vacuum": {
+        "clean": "start",
+        "dock": "return_to_base",
+        "home": "return_to_base",
+    },
 }
 
 
-def get_domain_info(domain: str) -> Optional[Dict[str, Any]]:
+def _build_action_resolvers() -> Dict[str, Dict[str, str]]:
+    """Build a per-domain alias -> service table.
+
+    Domain-specific aliases override common aliases, and aliases that are
+    already a valid service name for the domain are left out, so canonical
+    names miss the table and pass through unchanged.
+    """
+    resolvers: Dict[str, Dict[str, str]] = {}
+    for domain, info in DOMAIN_REGISTRY.items():
+        resolve = dict(ACTION_ALIASES)
+        resolve.update(DOMAIN_ACTION_ALIASES.get(domain, _EMPTY_MAPPING))
+        for service in info["services"]:
+            resolve.pop(service, None)
+        resolvers[domain] = resolve
+    return resolvers
+
+
+_ACTION_RESOLVERS = _build_action_resolvers()
+
+_DOMAIN_KEYS: Tuple[str, ...] = tuple(DOMAIN_REGISTRY)
+
+# Service sets for O(1) membership checks (lists are kept for ordered display)
+_SERVICE_SETS: Dict[str, FrozenSet[str]] = {
+    domain: frozenset(info["services"]) for domain, info in DOMAIN_REGISTRY.items()
+}
+
+
+def _build_domain_indexes() -> Tuple[Dict[str, Tuple[str, ...]], Dict[int, Tuple[str, ...]]]:
+    """Group domain names by type and by priority in a single pass."""
+    by_type: Dict[str, List[str]] = {}
+    by_priority: Dict[int, List[str]] = {}
+    for domain, info in DOMAIN_REGISTRY.items():
+        by_type.setdefault(info["type"], []).append(domain)
+        by_priority.setdefault(info["priority"], []).append(domain)
+    return (
+        {key: tuple(domains) for key, domains in by_type.items()},
+        {key: tuple(domains) for key, domains in by_priority.items()},
+    )
+
+
+_DOMAINS_BY_TYPE, _DOMAINS_BY_PRIORITY = _build_domain_indexes()
+
+# Read-only parameter views returned by get_service_parameters
+_EMPTY_PARAMS_VIEW: Mapping[str, Tuple[str, ...]] = MappingProxyType({"required": (), "optional": ()})
+_PARAMS_VIEWS: Dict[Tuple[str, str], Mapping[str, Tuple[str, ...]]] = {
+    (domain, service): MappingProxyType({
+        "required": tuple(params.get("required", ())),
+        "optional": tuple(params.get("optional", ())),
+    })
+    for domain, info in DOMAIN_REGISTRY.items()
+    for service, params in info["parameters"].items()
+}
+
+# Required parameter sets for services that have any
+_REQUIRED_PARAMS: Dict[Tuple[str, str], FrozenSet[str]] = {
+    (domain, service): frozenset(params["required"])
+    for domain, info in DOMAIN_REGISTRY.items()
+    for service, params in info["parameters"].items()
+    if params.get("required")
+}
+
+
+def _make_validator(domain: str, info: Mapping[str, Any]) -> Callable[[str], Tuple[bool, str]]:
+    """Build a validator for one domain with its services and messages baked in."""
+    if info["type"] == TYPE_READ_ONLY:
+        result = (
+            False,
+            info.get("error_message")
+            or f"Domain '{domain}' is read-only. Use 'get_entity_details' to read values.",
+        )
+        return lambda action: result
+
+    services = info["services"]
+    if not services:
+        result = (False, f"Domain '{domain}' has no available services")
+        return lambda action: result
+
+    service_set = _SERVICE_SETS[domain]
+    resolve = _ACTION_RESOLVERS[domain]
+    available = ", ".join(services[:5])
+
+    def validate(action: str) -> Tuple[bool, str]:
+        service = resolve.get(action, action)
+        if service in service_set:
+            return True, service
+        return False, f"Action '{action}' not valid for {domain}. Available: {available}"
+
+    return validate
+
+
+# Per-domain validators used by validate_domain_action
+_VALIDATORS: Dict[str, Callable[[str], Tuple[bool, str]]] = {
+    domain: _make_validator(domain, info) for domain, info in DOMAIN_REGISTRY.items()
+}
+
+
+def get_domain_info(domain: str) -> Optional[Mapping[str, Any]]:
     """Get domain configuration from registry.
 
     Args:
         domain: The domain name to look up
 
     Returns:
-        Domain configuration dict or None if not found
+        Read-only domain configuration or None if not found
     """
     return DOMAIN_REGISTRY.get(domain)
 
@@ -785,10 +905,7 @@ def get_supported_domains(priority: Optional[int] = None) -> List[str]:
     if priority is None:
         return list(DOMAIN_REGISTRY.keys())
 
-    return [
-        domain for domain, info in DOMAIN_REGISTRY.items()
-        if info.get("priority") == priority
-    ]
+    return list(_DOMAINS_BY_PRIORITY.get(priority, ()))
 
 
 def map_action_to_service(domain: str, action: str) -> str:
@@ -801,34 +918,19 @@ def map_action_to_service(domain: str, action: str) -> str:
     Returns:
         The actual service name to call
     """
-    # First check if it's already a valid service name
-    domain_info = get_domain_info(domain)
-    if domain_info and action in domain_info.get("services", []):
-        return action
-
-    # Check common aliases
-    if action in ACTION_ALIASES:
-        return ACTION_ALIASES[action]
-
-    # Domain-specific mappings
-    if domain == "cover":
-        if action in ["raise", "lift"]:
-            return "open_cover"
-        elif action in ["lower", "drop"]:
-            return "close_cover"
-    elif domain == "lock":
-        if action == "secure":
-            return "lock"
-        elif action == "unsecure":
-            return "unlock"
-    elif domain == "vacuum":
-        if action == "clean":
-            return "start"
-        elif action in ["dock", "home"]:
-            return "return_to_base"
-
-    # Default: return the action as-is
-    return action
+    # Unknown domains only get the common aliases; canonical names and
+    # unknown actions are returned as-is
+    return _ACTION_RESOLVERS.get(domain, ACTION_ALIASES).get(action, action)
+
+
+def _suggest_domains(domain: str) -> List[str]:
+    """Suggest up to three registered domains similar to an unknown domain name."""
+    similar = list(islice((d for d in _DOMAIN_KEYS if domain in d or d in domain), 3))
+    if similar:
+        return similar
+
+    # No substring match (typically a typo): fall back to fuzzy matching
+    return difflib.get_close_matches(domain, _DOMAIN_KEYS, n=3, cutoff=0.6)
 
 
 def validate_domain_action(domain: str, action: str) -> Tuple[bool, str]:
@@ -841,55 +943,30 @@ def validate_domain_action(domain: str, action: str) -> Tuple[bool, str]:
     Returns:
         Tuple of (is_valid, service_name_or_error_message)
     """
-    # Get domain info
-    domain_info = get_domain_info(domain)
+    validator = _VALIDATORS.get(domain)
+    if validator is not None:
+        return validator(action)
 
-    # Check if domain exists
-    if not domain_info:
-        # List similar domains if available
-        similar = [d for d in DOMAIN_REGISTRY.keys() if domain in d or d in domain]
-        if similar:
-            return False, f"Domain '{domain}' not supported. Did you mean: {', '.join(similar[:3])}?"
-        return False, f"Domain '{domain}' not supported. Use 'list_domains' to see available domains."
+    # Unknown domain: list similar domains if available
+    similar = _suggest_domains(domain)
+    if similar:
+        return False, f"Domain '{domain}' not supported. Did you mean: {', '.join(similar)}?"
+    return False, f"Domain '{domain}' not supported. Use 'list_domains' to see available domains."
 
-    # Check if domain is read-only
-    if domain_info["type"] == TYPE_READ_ONLY:
-        return False, domain_info.get("error_message", f"Domain '{domain}' is read-only. Use 'get_entity_details' to read values.")
 
-    # Map the action to a service name
-    service = map_action_to_service(domain, action)
-
-    # Check if service is valid for this domain
-    if service in domain_info.get("services", []):
-        return True, service
-
-    # Provide helpful error with available services
-    available_services = domain_info.get("services", [])
-    if available_services:
-        return False, f"Action '{action}' not valid for {domain}. Available: {', '.join(available_services[:5])}"
-
-    return False, f"Domain '{domain}' has no available services"
-
-
-def get_service_parameters(domain: str, service: str) -> Dict[str, List[str]]:
+def get_service_parameters(domain: str, service: str) -> Mapping[str, Tuple[str, ...]]:
     """Get required and optional parameters for a service.
 
+    The returned mapping is shared and read-only.
+
     Args:
         domain: The target domain
         service: The service name
 
     Returns:
-        Dict with 'required' and 'optional' parameter lists
+        Mapping with 'required' and 'optional' parameter tuples
     """
-    domain_info = get_domain_info(domain)
-    if not domain_info:
-        return {"required": [], "optional": []}
-
-    params = domain_info.get("parameters", {}).get(service, {})
-    return {
-        "required": params.get("required", []),
-        "optional": params.get("optional", [])
-    }
+    return _PARAMS_VIEWS.get((domain, service), _EMPTY_PARAMS_VIEW)
 
 
 def validate_service_parameters(domain: str, service: str, provided_params: Dict[str, Any]) -> Tuple[bool, str]:
@@ -903,12 +980,15 @@ def validate_service_parameters(domain: str, service: str, provided_params: Dict
     Returns:
         Tuple of (is_valid, error_message_or_success)
     """
-    params_info = get_service_parameters(domain, service)
-    required_params = params_info.get("required", [])
-
-    # Check for missing required parameters
-    missing = [p for p in required_params if p not in provided_params]
-    if missing:
+    required_params = _REQUIRED_PARAMS.get((domain, service))
+
+    # Check for missing required parameters (set comparison on the fast path,
+    # ordered list only when reporting)
+    if required_params and not required_params <= provided_params.keys():
+        missing = [
+            p for p in get_service_parameters(domain, service)["required"]
+            if p not in provided_params
+        ]
         return False, f"Missing required parameters for {domain}.{service}: {', '.join(missing)}"
 
     return True, "Parameters valid"
@@ -923,34 +1003,38 @@ def get_domains_by_type(domain_type: str) -> List[str]:
     Returns:
         List of domain names
     """
-    return [
-        domain for domain, info in DOMAIN_REGISTRY.items()
-        if info.get("type") == domain_type
-    ]
+    return list(_DOMAINS_BY_TYPE.get(domain_type, ()))
 
 
-def get_domain_statistics() -> Dict[str, int]:
-    """Get statistics about registered domains.
-
-    Returns:
-        Dict with counts by type and priority
-    """
+def _build_domain_statistics() -> Dict[str, int]:
+    """Count registered domains by type and priority from the prebuilt indexes."""
     stats = {
         "total": len(DOMAIN_REGISTRY),
-        "controllable": len(get_domains_by_type(TYPE_CONTROLLABLE)),
-        "read_only": len(get_domains_by_type(TYPE_READ_ONLY)),
-        "service_only": len(get_domains_by_type(TYPE_SERVICE_ONLY)),
+        "controllable": len(_DOMAINS_BY_TYPE.get(TYPE_CONTROLLABLE, ())),
+        "read_only": len(_DOMAINS_BY_TYPE.get(TYPE_READ_ONLY, ())),
+        "service_only": len(_DOMAINS_BY_TYPE.get(TYPE_SERVICE_ONLY, ())),
     }
 
     # Add priority counts
-    for priority in range(1, 7):
-        priority_domains = get_supported_domains(priority)
-        if priority_domains:
-            stats[f"priority_{priority}"] = len(priority_domains)
+    for priority in sorted(_DOMAINS_BY_PRIORITY):
+        stats[f"priority_{priority}"] = len(_DOMAINS_BY_PRIORITY[priority])
 
     return stats
 
 
+# The registry is immutable, so the statistics never change
+_DOMAIN_STATISTICS = _build_domain_statistics()
+
+
+def get_domain_statistics() -> Dict[str, int]:
+    """Get statistics about registered domains.
+
+    Returns:
+        Dict with counts by type and priority
+    """
+    return dict(_DOMAIN_STATISTICS)
+
+
 # Export the main functions
 __all__ = [
     "DOMAIN_REGISTRY",
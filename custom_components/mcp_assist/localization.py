@@ -6,7 +6,8 @@ This module provides language-specific defaults for:
 - End conversation word detection patterns
 """
 
-from typing import Optional
+from functools import lru_cache
+from typing import NamedTuple, Optional
 import logging
 
 _LOGGER = logging.getLogger(__name__)
@@ -99,6 +100,54 @@ END_WORDS = {
 }
 
 
+# System prompt language instructions, formatted once per language
+_LANGUAGE_INSTRUCTIONS = {
+    code: (
+        f"You are a helpful {lang_info['english']}-speaking Home Assistant voice assistant. "
+        f"Respond naturally and conversationally to user requests in {lang_info['native']}."
+    )
+    for code, lang_info in LANGUAGE_METADATA.items()
+}
+
+# Sorted language codes returned by get_supported_languages
+_SUPPORTED_LANGUAGES = tuple(sorted(LANGUAGE_METADATA))
+
+# Every language code defined in any of the tables above
+_KNOWN_CODES = frozenset(LANGUAGE_METADATA) | frozenset(FOLLOW_UP_PHRASES) | frozenset(END_WORDS)
+
+
+# (message, language code) pairs already logged, so a bad code warns only once
+_WARNED: set[tuple[str, str]] = set()
+
+
+def _warn_once(message: str, language_code: str) -> None:
+    """Log a missing-language warning the first time it occurs for a code."""
+    key = (message, language_code)
+    if key in _WARNED:
+        return
+    _WARNED.add(key)
+    _LOGGER.warning(message, language_code)
+
+
+@lru_cache(maxsize=64)
+def _base_code(language_code: str) -> Optional[str]:
+    """Resolve a language code to the table key that covers it.
+
+    Args:
+        language_code: ISO 639-1 language code (e.g., "de", "fr-CA", "zh-Hans")
+
+    Returns:
+        The matching table key (e.g., "fr-CA" -> "fr", "zh-Hans" -> "zh-hans"),
+        or None if the language is not defined.
+    """
+    base_code = language_code.lower()
+    if "-" in base_code and base_code not in _KNOWN_CODES:
+        # Try extracting just the base part for variants like "pt-BR" -> "pt"
+        base_code = base_code.split("-")[0]
+
+    return base_code if base_code in _KNOWN_CODES else None
+
+
 def get_language_instruction(language_code: str) -> str:
     """Generate language-specific system prompt.
 
@@ -117,25 +166,16 @@ def get_language_instruction(language_code: str) -> str:
     if language_code == "en" or language_code.startswith("en-"):
         return ""  # English uses default prompt
 
-    # Extract base language code (e.g., "fr-CA" -> "fr", "zh-Hans" -> "zh-hans")
-    base_code = language_code.lower()
-    if "-" in base_code and base_code not in LANGUAGE_METADATA:
-        # Try extracting just the base part for variants like "pt-BR" -> "pt"
-        base_code = base_code.split("-")[0]
-
-    lang_info = LANGUAGE_METADATA.get(base_code)
-    if not lang_info:
-        _LOGGER.warning(
+    instruction = _LANGUAGE_INSTRUCTIONS.get(_base_code(language_code))
+    if not instruction:
+        _warn_once(
             "Language '%s' not found in metadata. Using English defaults. "
             "Consider adding this language to localization.py",
             language_code
         )
         return ""  # Fallback: use English default
 
-    return (
-        f"You are a helpful {lang_info['english']}-speaking Home Assistant voice assistant. "
-        f"Respond naturally and conversationally to user requests in {lang_info['native']}."
-    )
+    return instruction
 
 
 def get_follow_up_phrases(language_code: str) -> str:
@@ -148,14 +188,9 @@ def get_follow_up_phrases(language_code: str) -> str:
         Comma-separated string of follow-up phrases in the specified language.
         Falls back to English if language not found.
     """
-    # Extract base language code
-    base_code = language_code.lower()
-    if "-" in base_code and base_code not in FOLLOW_UP_PHRASES:
-        base_code = base_code.split("-")[0]
-
-    phrases = FOLLOW_UP_PHRASES.get(base_code)
+    phrases = FOLLOW_UP_PHRASES.get(_base_code(language_code))
     if not phrases:
-        _LOGGER.warning(
+        _warn_once(
             "Follow-up phrases for language '%s' not found. Using English defaults. "
             "Consider adding this language to localization.py",
             language_code
@@ -175,14 +210,9 @@ def get_end_words(language_code: str) -> str:
         Comma-separated string of end words in the specified language.
         Falls back to English if language not found.
     """
-    # Extract base language code
-    base_code = language_code.lower()
-    if "-" in base_code and base_code not in END_WORDS:
-        base_code = base_code.split("-")[0]
-
-    words = END_WORDS.get(base_code)
+    words = END_WORDS.get(_base_code(language_code))
     if not words:
-        _LOGGER.warning(
+        _warn_once(
             "End words for language '%s' not found. Using English defaults. "
             "Consider adding this language to localization.py",
             language_code
@@ -192,10 +222,35 @@ def get_end_words(language_code: str) -> str:
     return words
 
 
+class LanguageBundle(NamedTuple):
+    """All language-specific defaults for one language code."""
+
+    instruction: str
+    follow_up_phrases: str
+    end_words: str
+
+
+@lru_cache(maxsize=16)
+def get_language_bundle(language_code: str) -> LanguageBundle:
+    """Get the language instruction, follow-up phrases and end words together.
+
+    Args:
+        language_code: ISO 639-1 language code (e.g., "de", "fr-CA", "zh-Hans")
+
+    Returns:
+        LanguageBundle with the same values the individual getters return.
+    """
+    return LanguageBundle(
+        get_language_instruction(language_code),
+        get_follow_up_phrases(language_code),
+        get_end_words(language_code),
+    )
+
+
 def get_supported_languages() -> list[str]:
     """Get list of all supported language codes.
 
     Returns:
         List of ISO 639-1 language codes.
     """
-    return sorted(LANGUAGE_METADATA.keys())
+    return list(_SUPPORTED_LANGUAGES)
@@ -23,6 +23,9 @@ from .const import (
     CONF_ALLOWED_IPS,
     CONF_SEARCH_PROVIDER,
     CONF_ENABLE_CUSTOM_TOOLS,
+    SEARCH_PROVIDER_NONE,
+    SEARCH_PROVIDER_BRAVE,
+    SEARCH_PROVIDER_DUCKDUCKGO,
     DEFAULT_LMSTUDIO_URL,
     DEFAULT_ALLOWED_IPS,
 )
@@ -90,6 +93,7 @@ class MCPServer:
 
         # Custom tools will be initialized in start() after system entry exists
         self.custom_tools = None
+        self._stopped = False
 
     def _get_shared_setting(self, key: str, default: Any) -> Any:
         """Get a shared setting from system entry with fallback to profile entry."""
@@ -120,9 +124,9 @@ class MCPServer:
 
         # Backward compat: if old enable_custom_tools was True, default to "brave"
         if self._get_shared_setting(CONF_ENABLE_CUSTOM_TOOLS, False):
-            return "brave"
+            return SEARCH_PROVIDER_BRAVE
 
-        return "none"
+        return SEARCH_PROVIDER_NONE
 
     async def start(self) -> None:
         """Start the MCP server."""
@@ -147,15 +151,7 @@ class MCPServer:
 
             # Create and initialize custom tools if search provider is enabled
             # Done here (not in __init__) so system entry exists for reading settings
-            search_provider = self._get_search_provider()
-            if search_provider in ["brave", "duckduckgo"]:
-                try:
-                    from .custom_tools import CustomToolsLoader
-                    self.custom_tools = CustomToolsLoader(self.hass, self.entry)
-                    await self.custom_tools.initialize()
-                    _LOGGER.info("✅ Custom tools initialized for search provider: %s", search_provider)
-                except Exception as e:
-                    _LOGGER.error(f"Failed to initialize custom tools: {e}")
+            self.custom_tools = await self._create_custom_tools()
 
             _LOGGER.info("✅ MCP server started successfully on http://0.0.0.0:%d", self.port)
             _LOGGER.info("🌐 MCP server is accessible from external machines")
@@ -177,10 +173,57 @@ class MCPServer:
             _LOGGER.error("❌ Failed to start MCP server: %s", err)
             raise
 
+    async def _create_custom_tools(self):
+        """Create custom tools for the current search provider, if any."""
+        search_provider = self._get_search_provider()
+        if search_provider not in (SEARCH_PROVIDER_BRAVE, SEARCH_PROVIDER_DUCKDUCKGO):
+            return None
+
+        custom_tools = None
+        try:
+            from .custom_tools import CustomToolsLoader
+            custom_tools = CustomToolsLoader(self.hass, self.entry)
+            await custom_tools.initialize()
+            _LOGGER.info("✅ Custom tools initialized for search provider: %s", search_provider)
+        except Exception as e:
+            _LOGGER.error(f"Failed to initialize custom tools: {e}")
+        return custom_tools
+
+    async def async_update_custom_tools(self) -> None:
+        """Rebuild custom tools if the shared search settings changed.
+
+        Profiles share this server, so reloading one profile does not restart
+        it; the system entry update listener calls this instead.
+        """
+        if self._stopped:
+            return
+
+        if self.custom_tools is not None:
+            if not self.custom_tools.is_stale():
+                return
+        elif self._get_search_provider() not in (SEARCH_PROVIDER_BRAVE, SEARCH_PROVIDER_DUCKDUCKGO):
+            return
+
+        _LOGGER.info("Search settings changed, reloading custom tools")
+        custom_tools = await self._create_custom_tools()
+
+        if self._stopped:
+            # Server stopped while the new tools were initializing
+            if custom_tools:
+                await custom_tools.close()
+            return
+
+        old_tools, self.custom_tools = self.custom_tools, custom_tools
+        if old_tools:
+            await old_tools.close()
+
     async def stop(self) -> None:
         """Stop the MCP server."""
         _LOGGER.info("Stopping MCP server")
+        self._stopped = True
 
+        if self.custom_tools:
+            await self.custom_tools.close()
         if self.site:
             await self.site.stop()
         if self.runner: